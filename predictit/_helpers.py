@@ -1,11 +1,23 @@
 """Internal module for some helping functions across library."""
 
 from __future__ import annotations
+from typing import Any
+from collections import OrderedDict
+from copy import deepcopy
+from pathlib import Path
+import hashlib
 
+import numpy as np
+import pandas as pd
+
+import mydatapreprocessing as mdp
 import mylogging
 
 from .configuration import Config
 
+# Results of predict function cached by `get_prediction_cache_key`. Last used result is at the end.
+prediction_cache: OrderedDict[str, Any] = OrderedDict()
+
 
 def logger_init_from_config(logger_config: Config.Output.LoggerSubconfig) -> None:
     mylogging.outer_warnings_filter(logger_config.ignored_warnings, logger_config.ignored_warnings_class_type)
@@ -15,3 +27,116 @@ def logger_init_from_config(logger_config: Config.Output.LoggerSubconfig) -> Non
     mylogging.config.FILTER = logger_config.logger_filter
     mylogging.config.COLORIZE = logger_config.logger_color
     mylogging._misc.filter_warnings()
+
+
+def copy_config(config: Config) -> Config:
+    """Copy config, but share data with original so it's not deep copied on every call.
+
+    Data are never changed inplace, only loaded list of data is edited in `load_data`, so list is copied.
+
+    Args:
+        config (Config): Copied config.
+
+    Returns:
+        Config: New config instance.
+    """
+    # Objects in memo are returned by deepcopy as they are
+    memo = {id(config.data_all): config.data_all}
+    if not isinstance(config.data, list):
+        memo[id(config.data)] = config.data
+
+    return deepcopy(config, memo)
+
+
+def load_data(config: Config) -> pd.DataFrame:
+    """Load data with values from config. If `data_cache_folder` is configured, data from local file are cached
+    there.
+
+    Args:
+        config (Config): Config with data and loading values.
+
+    Returns:
+        pd.DataFrame: Loaded data.
+    """
+    load_data_kwargs = {
+        "header": config.header,
+        "csv_style": config.csv_style,
+        "predicted_table": config.predicted_table,
+        "max_imported_length": config.max_imported_length,
+        "request_datatype_suffix": config.request_datatype_suffix,
+        "data_orientation": config.data_orientation,
+    }
+
+    cache_file = None
+
+    if config.data_cache_folder and isinstance(config.data, (str, Path)) and Path(config.data).is_file():
+        data_path = Path(config.data).resolve()
+        data_stat = data_path.stat()
+
+        # If file changes, modification time changes as well, so new cache is created
+        cache_key = hashlib.blake2b(
+            repr((data_path.as_posix(), data_stat.st_mtime_ns, data_stat.st_size, load_data_kwargs)).encode(),
+            digest_size=16,
+        ).hexdigest()
+        cache_file = Path(config.data_cache_folder) / f"{cache_key}.pkl"
+
+        if cache_file.exists():
+            return pd.read_pickle(cache_file)
+
+    data = mdp.load_data.load_data(config.data, **load_data_kwargs)
+
+    if cache_file:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        data.to_pickle(cache_file)
+
+    return data
+
+
+def get_prediction_cache_key(config: Config) -> str | None:
+    """Create hash of data and config values, so it's possible to find out, whether predict was already called
+    with the same inputs.
+
+    Args:
+        config (Config): Config with data and all other values.
+
+    Returns:
+        str | None: Hash of inputs. None if data cannot be hashed (e.g. list of data or database input).
+    """
+    data = config.data
+
+    try:
+        if isinstance(data, (pd.DataFrame, pd.Series)):
+            data_id = (
+                pd.util.hash_pandas_object(data, index=True).values.tobytes(),
+                repr(data.columns.tolist() if isinstance(data, pd.DataFrame) else data.name),
+            )
+        elif isinstance(data, np.ndarray):
+            data_id = (np.ascontiguousarray(data).tobytes(), data.shape, data.dtype.str)
+        elif isinstance(data, (str, Path)) and Path(data).is_file():
+            data_stat = Path(data).stat()
+            data_id = (Path(data).resolve().as_posix(), data_stat.st_mtime_ns, data_stat.st_size)
+        else:
+            return None
+    except TypeError:
+        return None
+
+    config_values = sorted(
+        (key, value) for key, value in config.get_dict().items() if key not in ("data", "data_all")
+    )
+
+    return hashlib.blake2b(repr((data_id, config_values)).encode(), digest_size=16).hexdigest()
+
+
+def cache_prediction(cache_key: str, result: Any, cache_size: int) -> None:
+    """Store result of predict in `prediction_cache`. If cache is full, least recently used result is removed.
+
+    Args:
+        cache_key (str): Key from `get_prediction_cache_key`.
+        result (Any): Cached result.
+        cache_size (int): Max number of cached results.
+    """
+    prediction_cache[cache_key] = result
+    prediction_cache.move_to_end(cache_key)
+
+    while len(prediction_cache) > cache_size:
+        prediction_cache.popitem(last=False)
@@ -13,6 +13,9 @@ import predictit
 # Lazy imports
 # import tracemalloc
 
+# Data shared by all tasks in pool process. Set once in `init_worker_data` when process starts.
+_worker_data: dict[str, Any] = {}
+
 # TODO Type hints
 
 # This is core function... It should be sequentially in the middle of main script in predict function,
@@ -39,9 +42,7 @@ def train_and_predict(
     data_std,
     last_undiff_value=None,
     final_scaler=None,
-    pipe=None,
-    semaphor=None,
-) -> None | dict[str, Any]:
+) -> dict[str, Any]:
     """Inner function, that can run in parallel with multiprocessing.
 
     Note:
@@ -51,13 +52,14 @@ def train_and_predict(
         Some values from predictit configuration.
 
     Returns:
-        None | dict[str, Any]: Return dict of results or send data via multiprocessing.
+        dict[str, Any]: Return dict of results.
     """
 
     logs_list = []
     warnings_list = []
 
-    if config["multiprocessing"]:
+    # Logs redirect is global, so not used in threads
+    if config["multiprocessing"] in ("process", "pool"):
         mylogging._misc.filter_warnings()
         mylogging.outer_warnings_filter(config["ignored_warnings"], config["ignored_warnings_class_type"])
         mylogging.config.BLACKLIST = config["ignored_warnings"]
@@ -72,9 +74,6 @@ def train_and_predict(
 
         mypythontools.tests.setup_tests(matplotlib_test_backend=True)
 
-    if semaphor:
-        semaphor.acquire()
-
     if config["trace_processes_memory"]:
         import tracemalloc
 
@@ -161,9 +160,10 @@ def train_and_predict(
             data_transform=config["data_transform"],
         )
 
-        tests_results = np.zeros((config["repeatit"], config["predicts"]))
-        test_errors_unstandardized = np.zeros((config["repeatit"], config["predicts"]))
-        test_errors = np.zeros(config["repeatit"])
+        # All values are assigned in loop, so no need to initialize
+        tests_results = np.empty((config["repeatit"], config["predicts"]))
+        test_errors_unstandardized = np.empty((config["repeatit"], config["predicts"]))
+        test_errors = np.empty(config["repeatit"])
 
         # Predict many values in test inputs to evaluate which models are best - do not inverse data preprocessing,
         # because test data are processed
@@ -203,8 +203,12 @@ def train_and_predict(
                 error_criterion=config["error_criterion"],
             )
 
-        model_results["Model error"] = test_errors.mean()
-        model_results["Unstandardized model error"] = test_errors.mean()
+        # Failed repetitions are ignored, error is nan only if all of them failed
+        valid_test_errors = test_errors[~np.isnan(test_errors)]
+        model_error = valid_test_errors.mean() if valid_test_errors.size else np.nan
+
+        model_results["Model error"] = model_error
+        model_results["Unstandardized model error"] = model_error
         model_results["Results"] = one_reality_result
         model_results["Test errors"] = test_errors
 
@@ -214,10 +218,8 @@ def train_and_predict(
             model_results["Trained model"] = trained_model
 
     except (Exception,):
-        results_array = np.zeros(config["predicts"])
-        results_array.fill(np.nan)
-        test_errors = np.zeros((config["repeatit"], config["predicts"]))
-        test_errors.fill(np.nan)
+        results_array = np.full(config["predicts"], np.nan)
+        test_errors = np.full((config["repeatit"], config["predicts"]), np.nan)
 
         model_results["Model error"] = np.inf
         model_results["Unstandardized model error"] = np.inf
@@ -245,15 +247,32 @@ def train_and_predict(
             model_results["Memory Peak\n[MB]"] = memory_peak_MB / 10 ** 6
             tracemalloc.stop()
 
-        if config["multiprocessing"]:
+        if config["multiprocessing"] in ("process", "pool"):
             logs_redirect.close_redirect()
 
-        if semaphor:
-            semaphor.release()
+        return {f"{result_name}": model_results}
+
+
+def init_worker_data(worker_data: dict[str, Any]) -> None:
+    """Pool initializer. Store data shared by all models in process, so it's not pickled with every task.
+
+    Args:
+        worker_data (dict[str, Any]): Dict with 'common' parameters and 'inputs' parameters for every input type.
+    """
+    global _worker_data
+    _worker_data = worker_data
+
 
-        if config["multiprocessing"] == "process":
-            pipe.send({f"{result_name}": model_results})
-            pipe.close()
+def train_and_predict_from_worker_data(data_inputs_name: str, **model_parameters) -> dict[str, Any]:
+    """Call `train_and_predict` with shared data stored in process with `init_worker_data`.
+
+    Args:
+        data_inputs_name (str): Input type used by model.
+        **model_parameters (dict): Parameters specific for the model, e.g. name or train function.
 
-        else:
-            return {f"{result_name}": model_results}
+    Returns:
+        dict[str, Any]: Return dict of results.
+    """
+    return train_and_predict(
+        **_worker_data["common"], **_worker_data["inputs"][data_inputs_name], **model_parameters
+    )
@@ -0,0 +1,200 @@
+"""Internal module with numba compiled kernels. It is imported only if numba is installed, numpy versions are used
+otherwise."""
+
+from __future__ import annotations
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(cache=True)
+def rolling_mean_std(data: np.ndarray, window: int) -> tuple[np.ndarray, np.ndarray]:
+    """Compute rolling mean and rolling standard deviation in one pass over the data. Mean and sum of squared
+    deviations are updated when value is added and removed from window (Welford's algorithm), so it's precise also
+    on data with big offset. Windows containing nan or inf are nan.
+
+    Note:
+        fastmath is not used here, because reordering of operations would break the precision.
+
+    Args:
+        data (np.ndarray): One-dimensional time series data.
+        window (int): Length of rolling window.
+
+    Returns:
+        np.ndarray, np.ndarray: Rolling mean and rolling std. Both have length `len(data) - window + 1`.
+    """
+    length = len(data) - window + 1
+    rolling_mean = np.empty(length)
+    rolling_std = np.empty(length)
+
+    # Values are shifted by the first finite value, so running mean is small and doesn't lose precision on big
+    # offset
+    shift = 0.0
+    for value in data:
+        if np.isfinite(value):
+            shift = value
+            break
+
+    mean = 0.0
+    squared_deviations = 0.0
+
+    # Non finite value would poison running sums for all the next windows, so such windows are nan and sums
+    # are computed again from scratch when last non finite value leaves the window
+    nonfinite_count = 0
+    for i in range(window):
+        if not np.isfinite(data[i]):
+            nonfinite_count += 1
+
+    recompute = True
+
+    for i in range(length):
+        if i > 0:
+            if not np.isfinite(data[i - 1]):
+                nonfinite_count -= 1
+            if not np.isfinite(data[i + window - 1]):
+                nonfinite_count += 1
+
+        if nonfinite_count:
+            rolling_mean[i] = np.nan
+            rolling_std[i] = np.nan
+            recompute = True
+            continue
+
+        if recompute:
+            mean = 0.0
+            squared_deviations = 0.0
+
+            for j in range(window):
+                value = data[i + j] - shift
+                delta = value - mean
+                mean += delta / (j + 1)
+                squared_deviations += delta * (value - mean)
+
+            recompute = False
+
+        else:
+            old_value = data[i - 1] - shift
+            new_value = data[i + window - 1] - shift
+
+            old_mean = mean
+            mean += (new_value - old_value) / window
+            squared_deviations += (new_value - old_value) * (new_value - mean + old_value - old_mean)
+
+        rolling_mean[i] = mean + shift
+        # Only rounding error can make it negative
+        rolling_std[i] = np.sqrt(max(squared_deviations / window, 0.0))
+
+    return rolling_mean, rolling_std
+
+
+@njit(cache=True)
+def describe(data: np.ndarray) -> tuple[float, float, float, float, int, int]:
+    """Compute basic statistics of data in one pass. Nan values are skipped. Mean and sum of squared deviations
+    are updated with Welford's algorithm, so it's precise also on data with big offset.
+
+    Note:
+        fastmath is not used here, because it would optimize out the nan checks.
+
+    Args:
+        data (np.ndarray): One-dimensional data.
+
+    Returns:
+        tuple[float, float, float, float, int, int]: Minimum, maximum, mean, sum of squared deviations from mean,
+        number of nan values and number of not nan values.
+    """
+    minimum = np.inf
+    maximum = -np.inf
+    mean = 0.0
+    squared_deviations = 0.0
+    count = 0
+    nan_count = 0
+
+    for value in data:
+        if np.isnan(value):
+            nan_count += 1
+            continue
+
+        if value < minimum:
+            minimum = value
+        if value > maximum:
+            maximum = value
+
+        count += 1
+        delta = value - mean
+        mean += delta / count
+        squared_deviations += delta * (value - mean)
+
+    return minimum, maximum, mean, squared_deviations, nan_count, count
+
+
+@njit(parallel=True, cache=True)
+def average_and_argmin(results: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Average results over last axis and find index of the best (lowest) average over second axis. Nan values are
+    taken as infinity (failed prediction). Outer axis is processed in parallel.
+
+    Args:
+        results (np.ndarray): Results in shape (models, optimized, dataset).
+
+    Returns:
+        np.ndarray, np.ndarray: Averages in shape (models, optimized) and indexes of the best optimized value
+        for each model.
+    """
+    models_number, optimized_number, dataset_number = results.shape
+    averages = np.empty((models_number, optimized_number))
+    best_indexes = np.zeros(models_number, dtype=np.int64)
+
+    for i in prange(models_number):
+        for j in range(optimized_number):
+            results_sum = 0.0
+            for k in range(dataset_number):
+                value = results[i, j, k]
+                if np.isnan(value):
+                    results_sum = np.inf
+                    break
+                results_sum += value
+            averages[i, j] = results_sum / dataset_number
+
+            if averages[i, j] < averages[i, best_indexes[i]]:
+                best_indexes[i] = j
+
+    return averages, best_indexes
+
+
+@njit(cache=True)
+def mape(predicted: np.ndarray, test: np.ndarray) -> float:
+    """Mean absolute percentage error. Test values smaller than 1 are replaced with 1, so there is no zero division.
+
+    Args:
+        predicted (np.ndarray): One-dimensional model output.
+        test (np.ndarray): One-dimensional correct values.
+
+    Returns:
+        float: Mape error in percents.
+    """
+    errors_sum = 0.0
+
+    for i in range(len(test)):
+        divisor = test[i] if abs(test[i]) >= 1 else 1.0
+        errors_sum += abs((test[i] - predicted[i]) / divisor)
+
+    return errors_sum / len(test) * 100
+
+
+@njit(cache=True)
+def rmse(predicted: np.ndarray, test: np.ndarray) -> float:
+    """Root mean squared error.
+
+    Args:
+        predicted (np.ndarray): One-dimensional model output.
+        test (np.ndarray): One-dimensional correct values.
+
+    Returns:
+        float: Rmse error.
+    """
+    squared_sum = 0.0
+
+    for i in range(len(test)):
+        error = predicted[i] - test[i]
+        squared_sum += error * error
+
+    return np.sqrt(squared_sum / len(test))
@@ -2,6 +2,7 @@
 static type analysis, intellisense etc."""
 
 from __future__ import annotations
+from typing import Callable
 
 import pandas as pd
 import numpy as np
@@ -18,20 +19,50 @@ class Misc:
 
 
 class Tables:
+    """Tables can be inserted as functions returning the string, so table is formatted only if it's used (printed
+    or accessed), not on every call."""
+
     def __init__(
         self,
-        simple: str,
-        detailed: str,
+        simple: str | Callable[[], str],
+        detailed: str | Callable[[], str],
         simple_table_df: pd.DataFrame,
         detailed_table_df: pd.DataFrame,
-        time: str = None,
+        time: str | Callable[[], str] | None = None,
     ):
-        self.simple = simple
-        self.detailed = detailed
-        self.time = time
+        self._tables = {"simple": simple, "detailed": detailed, "time": time}
         self.simple_table_df = simple_table_df
         self.detailed_table_df = detailed_table_df
 
+    def _get_table(self, name: str) -> str | None:
+        if callable(self._tables[name]):
+            self._tables[name] = self._tables[name]()
+        return self._tables[name]
+
+    @property
+    def simple(self) -> str:
+        return self._get_table("simple")
+
+    @simple.setter
+    def simple(self, new: str) -> None:
+        self._tables["simple"] = new
+
+    @property
+    def detailed(self) -> str:
+        return self._get_table("detailed")
+
+    @detailed.setter
+    def detailed(self, new: str) -> None:
+        self._tables["detailed"] = new
+
+    @property
+    def time(self) -> str | None:
+        return self._get_table("time")
+
+    @time.setter
+    def time(self, new: str | None) -> None:
+        self._tables["time"] = new
+
 
 class Optimization:
     def __init__(
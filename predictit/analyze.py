@@ -14,11 +14,12 @@ from predictit import misc
 
 # Lazy imports
 
-# import mydatapreprocessing
+# from predictit._numba_kernels import rolling_mean_std, describe, average_and_argmin
+# from scipy.linalg.blas import dsyrk
+# import bottleneck as bn
 
 # import matplotlib.pyplot as plt
 # import seaborn as sns
-# from statsmodels.graphics.tsaplots import plot_acf
 # from statsmodels.graphics.tsaplots import plot_pacf
 # from statsmodels.tsa.stattools import adfuller
 # from pandas.plotting import register_matplotlib_converters
@@ -41,13 +42,11 @@ def analyze_column(data: np.ndarray | pd.DataFrame, lags: int = 5, window: int =
 
     import matplotlib.pyplot as plt
     import seaborn as sns
-    from statsmodels.graphics.tsaplots import plot_acf
     from statsmodels.graphics.tsaplots import plot_pacf
     from statsmodels.tsa.stattools import adfuller
 
-    import mydatapreprocessing
-
-    data = np.array(data)
+    # No copy if data are already float array
+    data = np.asarray(data, dtype=np.float64)
 
     if data.ndim != 1 and 1 not in data.shape:
         raise ValueError(
@@ -59,16 +58,18 @@ def analyze_column(data: np.ndarray | pd.DataFrame, lags: int = 5, window: int =
 
     data = data.ravel()
 
+    minimum, maximum, mean, std, nan_count = _describe(data)
+
     print(
         f"Length: {len(data)}\n"
-        f"Minimum: {np.nanmin(data)}\n"
-        f"Maximum: {np.nanmax(data)}\n"
-        f"Mean: {np.nanmean(data)}\n"
-        f"Std: {np.nanstd(data)}\n"
+        f"Minimum: {minimum}\n"
+        f"Maximum: {maximum}\n"
+        f"Mean: {mean}\n"
+        f"Std: {std}\n"
         f"First few values: {data[-5:]}\n"
         f"Middle values: {data[int(-len(data)/2): int(-len(data)/2) + 5]}\n"
         f"Last few values: {data[-5:]}\n"
-        f"Number of nan (not a number) values: {np.count_nonzero(np.isnan(data))}\n"
+        f"Number of nan (not a number) values: {nan_count}\n"
     )
 
     # Data and it's distribution
@@ -94,7 +95,20 @@ def analyze_column(data: np.ndarray | pd.DataFrame, lags: int = 5, window: int =
 
     try:
 
-        plot_acf(data, lags=lags, ax=ax)
+        if lags >= len(data):
+            raise ValueError("Lags must be lower than number of values.")
+
+        acf_values = _fft_acf(data, lags)
+        lags_range = np.arange(lags + 1)
+
+        # Approximate 95% confidence interval with Bartlett's formula (same as statsmodels plot_acf)
+        acf_variance = np.ones(lags + 1) / len(data)
+        acf_variance[2:] *= 1 + 2 * np.cumsum(acf_values[1:-1] ** 2)
+        confidence_interval = 1.96 * np.sqrt(acf_variance)
+
+        ax.stem(lags_range, acf_values)
+        ax.fill_between(lags_range[1:], -confidence_interval[1:], confidence_interval[1:], alpha=0.25)
+        ax.set_title("Autocorrelation")
         ax.set_xlabel("Lag")
         plot_pacf(data, lags=lags, ax=ax2)
         ax2.set_xlabel("Lag")
@@ -106,8 +120,18 @@ def analyze_column(data: np.ndarray | pd.DataFrame, lags: int = 5, window: int =
         )
 
     # Moving average
-    rolling_mean = np.sum(mydatapreprocessing.misc.rolling_windows(data, window), 1)
-    rolling_std = np.std(mydatapreprocessing.misc.rolling_windows(data, window), 1)
+    if misc.GLOBAL_VARS.BOTTLENECK_INSTALLED:
+        import bottleneck as bn
+
+        # Bottleneck returns the same length as input with nan on positions where window is not complete
+        rolling_mean = bn.move_mean(data, window)[window - 1 :]
+        rolling_std = bn.move_std(data, window)[window - 1 :]
+    elif misc.GLOBAL_VARS.NUMBA_INSTALLED:
+        from predictit._numba_kernels import rolling_mean_std
+
+        rolling_mean, rolling_std = rolling_mean_std(data, window)
+    else:
+        rolling_mean, rolling_std = _rolling_mean_std(data, window)
 
     plt.figure(figsize=(10, 5))
     plt.subplot(1, 2, 1)
@@ -134,25 +158,113 @@ def analyze_column(data: np.ndarray | pd.DataFrame, lags: int = 5, window: int =
         print(f"\np-value = {pvalue} : Analyzed column is probably not stationary.\n")
 
 
-def analyze_data(data: pd.DataFrame | np.ndarray, pairplot: bool = False):
+def _describe(data: np.ndarray) -> tuple[float, float, float, float, int]:
+    """Compute minimum, maximum, mean, std and number of nan values. Nan values are skipped. If numba is installed,
+    all is computed in one pass.
+
+    Args:
+        data (np.ndarray): One-dimensional data.
+
+    Returns:
+        tuple[float, float, float, float, int]: Minimum, maximum, mean, std and number of nan values.
+    """
+    if misc.GLOBAL_VARS.NUMBA_INSTALLED:
+        from predictit._numba_kernels import describe
+
+        minimum, maximum, mean, squared_deviations, nan_count, count = describe(
+            np.asarray(data, dtype=np.float64)
+        )
+
+        if not count:
+            return np.nan, np.nan, np.nan, np.nan, nan_count
+
+        return minimum, maximum, mean, np.sqrt(squared_deviations / count), nan_count
+
+    # Mask nan values once, so plain reductions can be used instead of slower nan-aware ones
+    nan_mask = np.isnan(data)
+    nan_count = int(np.count_nonzero(nan_mask))
+    not_nan_data = data[~nan_mask] if nan_count else data
+
+    if not not_nan_data.size:
+        return np.nan, np.nan, np.nan, np.nan, nan_count
+
+    return not_nan_data.min(), not_nan_data.max(), not_nan_data.mean(), not_nan_data.std(), nan_count
+
+
+def _fft_acf(data: np.ndarray, lags: int) -> np.ndarray:
+    """Compute autocorrelation function with fast fourier transform (Wiener-Khinchin theorem). Complexity is
+    O(N log N) no matter how many lags are used.
+
+    Args:
+        data (np.ndarray): One-dimensional time series data.
+        lags (int): Number of lags.
+
+    Returns:
+        np.ndarray: Autocorrelation for lags 0 to `lags`.
+    """
+    data = np.asarray(data, dtype=np.float64)
+    data = data - data.mean()
+    length = len(data)
+
+    # Zero padding to avoid circular correlation. Power of two is the fastest size for FFT.
+    fft_size = 1 << (2 * length - 1).bit_length()
+    spectrum = np.fft.rfft(data, n=fft_size)
+    autocovariance = np.fft.irfft(spectrum * np.conjugate(spectrum), n=fft_size)[: lags + 1] / length
+
+    return autocovariance / autocovariance[0]
+
+
+def _rolling_mean_std(data: np.ndarray, window: int) -> tuple[np.ndarray, np.ndarray]:
+    """Compute rolling mean and rolling standard deviation on strided view of windows, so windows are not copied.
+    Std is computed in two passes (from deviations of window mean), so it's precise also on data with big offset,
+    where sum of squares minus squared mean would lose all the precision.
+
+    Args:
+        data (np.ndarray): One-dimensional time series data.
+        window (int): Length of rolling window.
+
+    Returns:
+        np.ndarray, np.ndarray: Rolling mean and rolling std. Both have length `len(data) - window + 1`.
+    """
+    windows = np.lib.stride_tricks.sliding_window_view(np.asarray(data, dtype=np.float64), window)
+
+    rolling_mean = windows.mean(axis=1)
+    rolling_std = windows.std(axis=1)
+
+    return rolling_mean, rolling_std
+
+
+def analyze_data(
+    data: pd.DataFrame | np.ndarray, pairplot: bool = False, return_only: bool = False
+) -> pd.DataFrame:
     """Analyze n-dimensional data. Describe data types, nan values, minimums etc...
     Plot correlation graph.
 
     Args:
         data (pd.DataFrame | np.ndarray): Time series data.
         pairplot (bool, optional): Whether to plot correlation matrix. Computation can be very slow. Defaults to False.
+        return_only (bool, optional): If True, nothing is printed nor plotted (no matplotlib figure is created),
+            correlation matrix is just returned. Defaults to False.
+
+    Returns:
+        pd.DataFrame: Correlation matrix of numeric columns.
     """
+    data = pd.DataFrame(data)
+    nan_mask = data.isna()
+    corr = _correlation(data, nan_mask)
+
+    if return_only:
+        return corr
+
     if not misc.GLOBAL_VARS.PLOTS_CONFIGURED:
         misc.setup_plots()
 
     import matplotlib.pyplot as plt
     import seaborn as sns
 
-    data = pd.DataFrame(data)
-
-    print("\n Data description \n", data.describe(include="all"))
+    print("\n Data description \n", data.describe())
     print("\n Data tail \n", data.tail())
-    print("\n Nan values in columns \n\n", str(data.isna().sum()))
+    print("\n Nan values in columns \n\n", str(nan_mask.sum()))
 
     # Pairplot unfortunately very slow
     if pairplot:
@@ -160,7 +272,6 @@ def analyze_data(data: pd.DataFrame | np.ndarray, pairplot: bool = False):
     else:
         plt.figure(figsize=(6, 5))
         plt.subplot(1, 1, 1)
-        corr = data.corr()
 
         ax = sns.heatmap(
             corr,
@@ -174,6 +285,60 @@ def analyze_data(data: pd.DataFrame | np.ndarray, pairplot: bool = False):
 
         plt.draw()
 
+    return corr
+
+
+def _correlation(data: pd.DataFrame, nan_mask: pd.DataFrame) -> pd.DataFrame:
+    """Compute correlation matrix of numeric data columns with matrix multiplication instead of `DataFrame.corr`
+    that is much slower. If there is no nan value, only upper triangle is computed. If there are nan values,
+    correlation is computed only from rows, where both columns are not nan (same as in `DataFrame.corr`).
+
+    Args:
+        data (pd.DataFrame): Analyzed data.
+        nan_mask (pd.DataFrame): Result of `data.isna()`.
+
+    Returns:
+        pd.DataFrame: Correlation matrix.
+    """
+    numeric_columns = data.select_dtypes(include=np.number).columns
+
+    if not len(numeric_columns):
+        return pd.DataFrame()
+
+    array = data[numeric_columns].to_numpy(dtype=np.float64)
+    not_nan = ~nan_mask[numeric_columns].to_numpy()
+
+    if not_nan.all():
+        from scipy.linalg.blas import dsyrk
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            standardized = (array - array.mean(axis=0)) / array.std(axis=0)
+
+        # Correlation matrix is symmetric, so syrk computes just upper triangle that is mirrored then
+        upper = dsyrk(1.0 / len(standardized), standardized.T, trans=0)
+        correlation = np.triu(upper) + np.triu(upper, k=1).T
+
+    else:
+        # Columns are centered, so sums of squares don't lose precision on data with big offset
+        array = np.where(not_nan, array, 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            column_means = array.sum(axis=0) / not_nan.sum(axis=0)
+        array = np.where(not_nan, array - column_means, 0)
+        not_nan = not_nan.astype(np.float64)
+
+        # Element [i, j] is computed only from rows, where both column i and column j are not nan
+        count = not_nan.T @ not_nan
+        sums = array.T @ not_nan
+        sums_squared = (array * array).T @ not_nan
+        products = array.T @ array
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            covariance = products - sums * sums.T / count
+            variance = sums_squared - sums * sums / count
+            correlation = covariance / np.sqrt(variance * variance.T)
+
+    return pd.DataFrame(np.atleast_2d(correlation), index=numeric_columns, columns=numeric_columns)
+
 
 def decompose(data: np.ndarray, period: int = 365, model: Literal["additive", "multiplicative"] = "additive"):
     """Plot decomposition graph. Analyze if data are seasonal.
@@ -223,7 +388,11 @@ def decompose(data: np.ndarray, period: int = 365, model: Literal["additive", "m
 
 
 def analyze_results(
-    results: np.ndarray, config_values_columns: list, models_columns: list, error_criterion: str = ""
+    results: np.ndarray,
+    config_values_columns: list,
+    models_columns: list | tuple,
+    error_criterion: str = "",
+    low_precision: bool = False,
 ) -> tuple:
     """Multiple predictions for various optimized config variable values are made, then errors (difference from true
     values) are evaluated. This is input. Outputs are averaged errors through datasets, what model is the best,
@@ -234,34 +403,63 @@ def analyze_results(
             optimized and models are analyzed.
         config_values_columns (list): Names of second dim in results. Usually some config values is optimized,
             so that means values of optimized variable that is predicted in for loop.
-        models_columns (list): Names of used models.
+        models_columns (list | tuple): Names of used models. Order must match last dim in results, so set is not
+            allowed.
         error_criterion(string, optional): If config values evaluated.
             Used as column name. Defaults to ""
+        low_precision (bool, optional): Whether reduce results in float32. It halves the memory that is moved,
+            what is faster on big results. Returned errors are float64 anyway. Defaults to False.
 
     Returns:
         np.ndarray, list, str, str: Models with best optimized average results, best optimized form models,
         best model name and best optimized for all models together.
     """
-    results[np.isnan(results)] = np.inf
-    results_average = np.nanmean(results, axis=0)
+    if not isinstance(models_columns, (list, tuple)):
+        raise TypeError(
+            mylogging.return_str("Models names must be list or tuple, so order is the same as in results.")
+        )
+
+    # Shape (models, optimized, dataset), so reduced dataset axis is contiguous in memory. It's always a copy (also
+    # if transposed array is already contiguous), so input array is not changed.
+    results = np.array(
+        results.transpose(2, 1, 0), dtype=np.float32 if low_precision else None, order="C", copy=True
+    )
 
     # Analyze models - choose just the best optimized value
-    best_optimized_indexes_errors = np.nanargmin(results_average, axis=0)  # Indexes of best optimized
+    if misc.GLOBAL_VARS.NUMBA_INSTALLED and results.size > 1_000_000:
+        from predictit._numba_kernels import average_and_argmin
+
+        # Parallel on large arrays, numpy reductions are single threaded
+        results_average, best_optimized_indexes_errors = average_and_argmin(results)
+
+    elif misc.GLOBAL_VARS.BOTTLENECK_INSTALLED:
+        import bottleneck as bn
+
+        results[np.isnan(results)] = np.inf
+        results_average = bn.nanmean(results, axis=-1)
+        best_optimized_indexes_errors = bn.nanargmin(results_average, axis=1)  # Indexes of best optimized
+
+    else:
+        results[np.isnan(results)] = np.inf
+        results_average = np.nanmean(results, axis=-1)
+        best_optimized_indexes_errors = np.nanargmin(results_average, axis=1)  # Indexes of best optimized
 
     best_optimized_values = [
         config_values_columns[index] for index in best_optimized_indexes_errors
     ]  # Best optimized for models
 
-    best_results_errors = np.nanmin(results_average, axis=0)  # Results if only best optimized are used
+    # Results if only best optimized are used
+    best_results_errors = np.take_along_axis(results_average, best_optimized_indexes_errors[:, None], axis=1)
+    best_results_errors = best_results_errors.ravel().astype(np.float64)
     best_model_index = int(np.nanargmin(best_results_errors))
-    best_model_name = list(models_columns)[best_model_index]
+    best_model_name = models_columns[best_model_index]
 
     # Analyze optimized variables - keep all results for defined optimized values
-    if results_average.shape[0] == 1:
+    if results_average.shape[1] == 1:
         best_optimized_value = "Not optimized"
         optimized_values_results_df = None
     else:
-        all_models_errors_average = np.nanmean(results_average, axis=1)
+        all_models_errors_average = np.nanmean(results_average, axis=0, dtype=np.float64)
         best_optimized_index = np.nanargmin(all_models_errors_average)
         best_optimized_value = config_values_columns[best_optimized_index]
 
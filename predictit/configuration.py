@@ -95,16 +95,20 @@ class Config(ConfigStructured):
 
             return None
 
-        @MyProperty(options=["pool", "process", None])
+        @MyProperty(options=["pool", "process", "thread", None])
         def multiprocessing(self) -> None | str:
             """
             Options:
-                'pool', 'process', None.
+                'pool', 'process', 'thread', None.
 
             Default:
                 None
 
-            Don't use 'process' on windows. Multiprocessing beneficial mostly on bigger data and linux..."""
+            Don't use 'process' on windows. Multiprocessing beneficial mostly on bigger data and linux...
+            If None and all used models are in `predictit.models.gil_releasing_models`, 'thread' is used, so data
+            are not pickled to other processes. 'thread' is not used if `trace_processes_memory` is True.
+            In predict_multiple_columns and compare_models, columns or data are evaluated in threads if 'thread',
+            in processes otherwise."""
             return None
 
         @MyProperty((int, None))
@@ -120,6 +124,21 @@ class Config(ConfigStructured):
 
             return None
 
+        @MyProperty(int)
+        def prediction_cache_size(self) -> int:
+            """
+            Type:
+                int
+
+            Default:
+                0
+
+            If bigger than 0, results of `predict` are cached in memory and if `predict` is called again with
+            the same data and config, cached result is returned and models are not computed again. Value is max
+            number of cached results. Useful for example if comparing models or sweeping parameters repeatedly."""
+
+            return 0
+
         # Data analysis
         @MyProperty(int)
         def analyzeit(self) -> int:
@@ -273,11 +292,11 @@ class Config(ConfigStructured):
 
             return None
 
-        @MyProperty((int, None))
-        def header(self) -> str | bool:
+        @MyProperty((int, str, None))
+        def header(self) -> int | str | None:
             """
             Types:
-                int | None
+                int | str | None
 
             Default:
                 'infer'
@@ -425,6 +444,19 @@ class Config(ConfigStructured):
             Max length of imported samples (before resampling). If 0, than full length."""
             return 100000
 
+        @MyProperty((str, Path, None))
+        def data_cache_folder(self) -> str | Path | None:
+            """
+            Types:
+                str | Path | None
+
+            Default:
+                None
+
+            If configured, data loaded from local file are cached in this folder and next time loaded from there,
+            so file doesn't have to be parsed again. If file changes, it's loaded again."""
+            return None
+
         # Data inputs definition
         @MyProperty(int)
         def default_n_steps_in(self) -> int:
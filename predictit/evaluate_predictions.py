@@ -16,6 +16,7 @@ from predictit import misc
 # import matplotlib.pyplot as plt
 # from sklearn.metrics import mean_squared_error
 # from dtaidistance import dtw
+# from predictit._numba_kernels import mape, rmse
 
 
 def compare_predicted_to_test(
@@ -63,7 +64,10 @@ def compare_predicted_to_test(
             plt.title("Prediction with \n {} with data {}".format(model_name, data_name))
             plt.show()
 
-        error = np.array(predicted) - np.array(test)
+        error = np.asarray(predicted) - np.asarray(test)
+
+        # Compiled kernels are used on one dimensional data, numpy otherwise
+        use_numba = misc.GLOBAL_VARS.NUMBA_INSTALLED and error.ndim == 1
 
         """
         abs_error = [abs(i) for i in error]
@@ -82,12 +86,26 @@ def compare_predicted_to_test(
             criterion_value = max_error(test, predicted)
 
         elif error_criterion == "rmse":
-            rmseerror = error ** 2
-            criterion_value = (sum(rmseerror) / predicts) ** (1 / 2)
+            if use_numba:
+                from predictit._numba_kernels import rmse
+
+                criterion_value = rmse(
+                    np.asarray(predicted, dtype=np.float64), np.asarray(test, dtype=np.float64)
+                )
+            else:
+                rmseerror = error ** 2
+                criterion_value = (np.sum(rmseerror, axis=0) / predicts) ** (1 / 2)
 
         elif error_criterion == "mape":
-            no_zero_test = np.where(abs(test) >= 1, test, 1)
-            criterion_value = np.mean(np.abs((test - predicted) / no_zero_test)) * 100
+            if use_numba:
+                from predictit._numba_kernels import mape
+
+                criterion_value = mape(
+                    np.asarray(predicted, dtype=np.float64), np.asarray(test, dtype=np.float64)
+                )
+            else:
+                no_zero_test = np.where(abs(test) >= 1, test, 1)
+                criterion_value = np.mean(np.abs((test - predicted) / no_zero_test)) * 100
 
         elif error_criterion == "dtw":
 
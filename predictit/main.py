@@ -27,14 +27,17 @@ from pathlib import Path
 import os
 import warnings
 import time
-import argparse
+import hashlib
 import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 import inspect
 import io
+import contextlib
+from copy import deepcopy
+from functools import partial
 
 import numpy as np
 import pandas as pd
-from tabulate import tabulate
 
 import mydatapreprocessing as mdp
 import mylogging
@@ -43,6 +46,8 @@ import mypythontools
 
 # Lazy imports
 # from tabulate import tabulate
+# import argparse
+# import bottleneck as bn
 
 # Get module path and insert in sys path for working even if opened from other cwd (current working directory)
 try:
@@ -101,12 +106,12 @@ def predict(
     if config is None or isinstance(config, dict):
         update_config = config
         config = config_default
-        config = config.copy()
+        config = predictit._helpers.copy_config(config)
         if update_config:
             config.update(update_config)
 
     elif isinstance(config, predictit.configuration.Config):
-        config = config.copy()
+        config = predictit._helpers.copy_config(config)
 
     if config.use_config_preset and config.use_config_preset != "none":
         updated_config = config.presets[config.use_config_preset]
@@ -121,6 +126,17 @@ def predict(
 
     config.update(kwargs)
 
+    # Used models can be set, but order must be fixed, as results are stored and analyzed on model index
+    config.used_models = list(config.used_models)
+
+    # If predict was already called with the same data and config, result is not computed again. It's before
+    # logger init, so warnings filters are not changed if cached result is returned.
+    cache_key = predictit._helpers.get_prediction_cache_key(config) if config.prediction_cache_size else None
+
+    if cache_key in predictit._helpers.prediction_cache:
+        predictit._helpers.prediction_cache.move_to_end(cache_key)
+        return deepcopy(predictit._helpers.prediction_cache[cache_key])
+
     predictit._helpers.logger_init_from_config(config.output.logger_subconfig)
 
     # Do not repeat actually mean evaluate once
@@ -129,10 +145,9 @@ def predict(
 
     _GUI = GLOBAL_VARS.GUI
 
-    # Add everything printed + warnings to variable to be able to print in GUI
-    if _GUI:
-        stdout = sys.stdout
-        sys.stdout = io.StringIO()
+    # Add everything printed to variable to be able to print in GUI. Only parts that print are redirected
+    gui_output = io.StringIO()
+    collect_output = contextlib.redirect_stdout(gui_output) if _GUI else contextlib.nullcontext()
 
     # Don't want to define in gui condition, so if not gui, do nothing
     if _GUI:
@@ -164,15 +179,7 @@ def predict(
     progress_phase = "Data loading and preprocessing"
     update_gui(progress_phase, "progress_phase")
 
-    data = mdp.load_data.load_data(
-        config.data,
-        header=config.header,
-        csv_style=config.csv_style,
-        predicted_table=config.predicted_table,
-        max_imported_length=config.max_imported_length,
-        request_datatype_suffix=config.request_datatype_suffix,
-        data_orientation=config.data_orientation,
-    )
+    data = predictit._helpers.load_data(config)
 
     ###############
     ### ANCHOR ### Data consolidation
@@ -206,44 +213,61 @@ def predict(
 
     column_for_predictions_series = data_for_predictions_df.iloc[:, 0:1]
     results = {}
-    data_inputs = []
 
     if config.mode == "validate":
         column_for_predictions_series = column_for_predictions_series.iloc[: -config.output.predicts, :]
         config.repeatit = 1
 
-    for i in config.used_models:
-        data_inputs.append(config.models_input[i])
-    data_inputs = set(data_inputs)
+    # Models grouped by input type, so only models using created input are iterated. Index is position in
+    # used_models, so results are on the right place in results matrix.
+    models_by_input = {}
+    for i, j in enumerate(config.used_models):
+        models_by_input.setdefault(config.models_input[j], {})[i] = j
 
     if config.analyzeit == 1 or config.analyzeit == 3:
-        print("Analyze of unprocessed data")
-        try:
-            predictit.analyze.analyze_column(data_for_predictions_df.values[:, 0], window=30)
-            predictit.analyze.analyze_data(data_for_predictions_df)
-            predictit.analyze.decompose(
-                data_for_predictions_df.values[:, 0],
-                **config.analyze_seasonal_decompose,
-            )
-        except Exception:
-            mylogging.traceback("Analyze failed", level="ERROR")
+        with collect_output:
+            print("Analyze of unprocessed data")
+            try:
+                predictit.analyze.analyze_column(data_for_predictions_df.values[:, 0], window=30)
+                predictit.analyze.analyze_data(data_for_predictions_df)
+                predictit.analyze.decompose(
+                    data_for_predictions_df.values[:, 0],
+                    **config.analyze_seasonal_decompose,
+                )
+            except Exception:
+                mylogging.traceback("Analyze failed", level="ERROR")
 
-    semaphor = None
+    # tracemalloc used for tracing memory is process global, so it cannot be used in threads
+    if config.trace_processes_memory and config.multiprocessing == "thread":
+        mylogging.warn(
+            "Memory of models cannot be traced in threads, so 'thread' multiprocessing is not used."
+        )
+        config.multiprocessing = None
+
+    # Models computing mostly in numpy release GIL, so if multiprocessing is not configured, threads are used
+    # (data are not pickled). Explicitly configured multiprocessing is not changed.
+    elif (
+        config.multiprocessing is None
+        and not config.trace_processes_memory
+        and set(config.used_models) <= predictit.models.gil_releasing_models
+    ):
+        config.multiprocessing = "thread"
 
     if config.multiprocessing:
 
         multiprocessing.freeze_support()
 
         if not config.processes_limit:
-            config.processes_limit = multiprocessing.cpu_count() - 1
+            config.processes_limit = max(multiprocessing.cpu_count() - 1, 1)
 
-        if config.multiprocessing == "process":
-            pipes = []
-            semaphor = multiprocessing.Semaphore(config.processes_limit)
+        if config.multiprocessing in ("process", "thread"):
+            # One executor for all models, so there is no new process and pipe for every model
+            executor = (ProcessPoolExecutor if config.multiprocessing == "process" else ThreadPoolExecutor)(
+                config.processes_limit
+            )
+            futures = []
 
         elif config.multiprocessing == "pool":
-            pool = multiprocessing.Pool(config.processes_limit)
-
             # It is not possible easy share data in multiprocessing, so results are resulted via callback function
             def return_result(result):
                 for i, j in result.items():
@@ -265,12 +289,17 @@ def predict(
     progress_phase = "Predict"
     update_gui(progress_phase, "progress_phase")
 
-    models_indexed = {i: j for i, j in enumerate(config.used_models)}
+    # Snapshot config only once. Data are not used in models, so it's not pickled to every process
+    base_config_snapshot = {k: v for k, v in config.get_dict().items() if k not in ("data", "data_all")}
 
     ###############
     ### ANCHOR ### Main loop
     #############
 
+    # Model inputs are reused in next optimization iteration if optimized variable doesn't change the data
+    model_inputs_cache = {}
+    model_inputs_cache_data_hash = None
+
     for optimization_index, optimization_value in enumerate(config.optimization_values):
 
         # TODO check why setattr - may be wrong after config change
@@ -307,11 +336,10 @@ def predict(
             models_test_outputs_unstandardized = [test_unstandardized]
 
         else:
-            models_test_outputs_unstandardized = mdp.create_model_inputs.create_tests_outputs(
-                data_for_predictions_df.values[:, 0],
-                predicts=config.predicts,
-                repeatit=config.repeatit,
-            )
+            # Last repeatit windows of predicted column as zero-copy view
+            models_test_outputs_unstandardized = np.lib.stride_tricks.sliding_window_view(
+                data_for_predictions_df.values[:, 0], config.predicts
+            )[-config.repeatit :]
 
         data_for_predictions, last_undiff_value, final_scaler = mdp.preprocessing.preprocess_data(
             data_for_predictions_df.values,
@@ -331,23 +359,28 @@ def predict(
             models_test_outputs = [test]
 
         else:
-            models_test_outputs = mdp.create_model_inputs.create_tests_outputs(
-                data_for_predictions[:, 0],
-                predicts=config.predicts,
-                repeatit=config.repeatit,
-            )
+            models_test_outputs = np.lib.stride_tricks.sliding_window_view(
+                data_for_predictions[:, 0], config.predicts
+            )[-config.repeatit :]
+
+        data_hash = hashlib.blake2b(
+            np.ascontiguousarray(data_for_predictions).tobytes(), digest_size=16
+        ).digest()
+
+        if data_hash != model_inputs_cache_data_hash:
+            model_inputs_cache = {}
+            model_inputs_cache_data_hash = data_hash
 
         column_for_predictions_processed = data_for_predictions[:, predicted_column_index]
 
         data_shape = np.shape(data_for_predictions)
         data_length = len(column_for_predictions_processed)
 
-        data_std = np.std(column_for_predictions_processed[-30:])
-        data_mean = np.mean(column_for_predictions_processed[-30:])
-        data_abs_max = max(
-            abs(column_for_predictions_processed.min()),
-            abs(column_for_predictions_processed.max()),
-        )
+        column_tail = column_for_predictions_processed[-30:]
+        data_mean = column_tail.mean()
+        data_std = column_tail.std()
+        # Without abs on whole column, max(-min, max) is max of absolute values
+        data_abs_max = max(-column_for_predictions_processed.min(), column_for_predictions_processed.max())
 
         multicolumn = 0 if data_shape[1] == 1 else 1
 
@@ -355,17 +388,18 @@ def predict(
             config.optimization_values
         ) - 1:
 
-            print("\n\nAnalyze of preprocessed data\n")
-            try:
-                predictit.analyze.analyze_column(column_for_predictions_processed, window=30)
-                predictit.analyze.analyze_data(data_for_predictions)
-                predictit.analyze.decompose(
-                    column_for_predictions_processed,
-                    **config.analyze_seasonal_decompose,
-                )
+            with collect_output:
+                print("\n\nAnalyze of preprocessed data\n")
+                try:
+                    predictit.analyze.analyze_column(column_for_predictions_processed, window=30)
+                    predictit.analyze.analyze_data(data_for_predictions)
+                    predictit.analyze.decompose(
+                        column_for_predictions_processed,
+                        **config.analyze_seasonal_decompose,
+                    )
 
-            except Exception:
-                mylogging.traceback("Analyze failed", level="ERROR")
+                except Exception:
+                    mylogging.traceback("Analyze failed", level="ERROR")
 
         min_data_length = 3 * config.predicts + config.default_n_steps_in
 
@@ -381,108 +415,141 @@ def predict(
             caption="To few data",
         )
 
-        for data_inputs_name in data_inputs:
-            try:
-                (
-                    model_train_input,
-                    model_predict_input,
-                    model_test_inputs,
-                ) = mdp.create_model_inputs.create_inputs(
-                    data_for_predictions,
-                    input_type_name=data_inputs_name,
-                    input_type_params=config.data_inputs[data_inputs_name],
-                    mode=config.mode,
-                    predicts=config.predicts,
-                    repeatit=config.repeatit,
-                    predicted_column_index=predicted_column_index,
-                )
+        # Only values that can change in this loop are updated
+        config_snapshot = {**base_config_snapshot, "repeatit": config.repeatit}
+        if config.optimization_variable:
+            config_snapshot[config.optimization_variable] = optimization_value
+
+        # Parameters are split by how often they change, so pool can send shared ones to process only once
+        common_parameters = {
+            "config": config_snapshot,
+            # Functions to not import all modules
+            "preprocess_data_inverse": mdp.preprocessing.preprocess_data_inverse,
+            "fitted_power_transform": mdp.preprocessing.fitted_power_transform,
+            # Other
+            "optimization_index": optimization_index,
+            "optimization_value": optimization_value,
+            "models_test_outputs": models_test_outputs,
+            "models_test_outputs_unstandardized": models_test_outputs_unstandardized,
+            "data_abs_max": data_abs_max,
+            "data_mean": data_mean,
+            "data_std": data_std,
+            "last_undiff_value": last_undiff_value,
+            "final_scaler": final_scaler,
+        }
+        inputs_parameters = {}
+        pool_tasks = []
+
+        for data_inputs_name, input_models in models_by_input.items():
+            inputs_key = (
+                data_inputs_name,
+                repr(config.data_inputs[data_inputs_name]),
+                config.repeatit,
+                config.predicts,
+                config.mode,
+            )
 
-            except Exception:
-                mylogging.traceback(
-                    f"Error in creating input type: {data_inputs_name} with option optimization: {optimization_value}",
-                    level="WARNING",
-                )
-                continue
+            if inputs_key in model_inputs_cache:
+                model_train_input, model_predict_input, model_test_inputs = model_inputs_cache[inputs_key]
+
+            else:
+                try:
+                    (
+                        model_train_input,
+                        model_predict_input,
+                        model_test_inputs,
+                    ) = mdp.create_model_inputs.create_inputs(
+                        data_for_predictions,
+                        input_type_name=data_inputs_name,
+                        input_type_params=config.data_inputs[data_inputs_name],
+                        mode=config.mode,
+                        predicts=config.predicts,
+                        repeatit=config.repeatit,
+                        predicted_column_index=predicted_column_index,
+                    )
+
+                except Exception:
+                    mylogging.traceback(
+                        f"Error in creating input type: {data_inputs_name} with option optimization: {optimization_value}",
+                        level="WARNING",
+                    )
+                    continue
+
+                model_inputs_cache[inputs_key] = (model_train_input, model_predict_input, model_test_inputs)
 
-            for (iterated_model_index, iterated_model_name) in models_indexed.items():
+            inputs_parameters[data_inputs_name] = {
+                "model_train_input": model_train_input,
+                "model_predict_input": model_predict_input,
+                "model_test_inputs": model_test_inputs,
+            }
+
+            for iterated_model_index, iterated_model_name in input_models.items():
                 iterated_model = predictit.models.models_assignment[iterated_model_name]
 
-                if config.models_input[iterated_model_name] == data_inputs_name:
-
-                    predict_parameters = {
-                        "config": config.get_dict(),
-                        # Functions to not import all modules
-                        "preprocess_data_inverse": mdp.preprocessing.preprocess_data_inverse,
-                        "fitted_power_transform": mdp.preprocessing.fitted_power_transform,
-                        # Other
-                        "iterated_model_train": iterated_model.train,
-                        "iterated_model_predict": iterated_model.predict,
-                        "iterated_model_name": iterated_model_name,
-                        "iterated_model_index": iterated_model_index,
-                        "optimization_index": optimization_index,
-                        "optimization_value": optimization_value,
-                        "model_train_input": model_train_input,
-                        "model_predict_input": model_predict_input,
-                        "model_test_inputs": model_test_inputs,
-                        "models_test_outputs": models_test_outputs,
-                        "models_test_outputs_unstandardized": models_test_outputs_unstandardized,
-                        "data_abs_max": data_abs_max,
-                        "data_mean": data_mean,
-                        "data_std": data_std,
-                        "last_undiff_value": last_undiff_value,
-                        "final_scaler": final_scaler,
-                        "semaphor": semaphor,
-                    }
-
-                    if config.models_input[iterated_model_name] in [
-                        "one_step",
-                        "one_step_constant",
-                    ]:
-                        if multicolumn and config.predicts > 1:
-                            mylogging.warn(
-                                f"Warning in model {iterated_model_name} \n\nOne-step prediction on "
-                                "multivariate data (more columns). Use multi_step (y lengt equals to predict) "
-                                "or do use some one column data input in config models_input or predict just one value."
-                            )
-                            continue
-
-                    if config.multiprocessing == "process":
-
-                        pipes.append(multiprocessing.Pipe(duplex=False))
-                        p = multiprocessing.Process(
-                            target=predictit._main_loop.train_and_predict,
-                            kwargs={**predict_parameters, **{"pipe": pipes[-1][1]}},
+                model_parameters = {
+                    "iterated_model_train": iterated_model.train,
+                    "iterated_model_predict": iterated_model.predict,
+                    "iterated_model_name": iterated_model_name,
+                    "iterated_model_index": iterated_model_index,
+                }
+                predict_parameters = {
+                    **common_parameters,
+                    **inputs_parameters[data_inputs_name],
+                    **model_parameters,
+                }
+
+                if data_inputs_name in ["one_step", "one_step_constant"]:
+                    if multicolumn and config.predicts > 1:
+                        mylogging.warn(
+                            f"Warning in model {iterated_model_name} \n\nOne-step prediction on "
+                            "multivariate data (more columns). Use multi_step (y lengt equals to predict) "
+                            "or do use some one column data input in config models_input or predict just one value."
                         )
+                        continue
 
-                        p.Daemon = True  # Baby process will be terminated if parent killed
-                        p.start()
+                if config.multiprocessing in ("process", "thread"):
 
-                    elif config.multiprocessing == "pool":
+                    futures.append(
+                        executor.submit(predictit._main_loop.train_and_predict, **predict_parameters)
+                    )
 
-                        pool.apply_async(
-                            predictit._main_loop.train_and_predict,
-                            (),
-                            predict_parameters,
-                            callback=return_result,
-                        )
+                elif config.multiprocessing == "pool":
+                    pool_tasks.append((data_inputs_name, model_parameters))
 
-                    else:
+                else:
+                    with collect_output:
                         results = {
                             **results,
                             **predictit._main_loop.train_and_predict(**predict_parameters),
                         }
 
+        if pool_tasks:
+            # Data shared by models are sent once to every process in initializer, tasks contain only model
+            with multiprocessing.Pool(
+                config.processes_limit,
+                initializer=predictit._main_loop.init_worker_data,
+                initargs=({"common": common_parameters, "inputs": inputs_parameters},),
+            ) as pool:
+                for data_inputs_name, model_parameters in pool_tasks:
+                    pool.apply_async(
+                        predictit._main_loop.train_and_predict_from_worker_data,
+                        (data_inputs_name,),
+                        model_parameters,
+                        callback=return_result,
+                    )
+
+                pool.close()
+                pool.join()
+
     if config.multiprocessing:
-        if config.multiprocessing == "process":
-            for i in pipes:
+        if config.multiprocessing in ("process", "thread"):
+            for future in as_completed(futures):
                 try:
-                    results = {**results, **i[0].recv()}
+                    results = {**results, **future.result()}
                 except Exception:
                     pass
 
-        if config.multiprocessing == "pool":
-            pool.close()
-            pool.join()
+            executor.shutdown()
 
         for i in results.values():
             mylogging.my_logger.log_and_warn_from_lists(i["logs_list"], i["warnings_list"])
@@ -534,11 +601,13 @@ def predict(
             )
         )
 
-    evaluated_matrix = np.zeros((1, len(config.optimization_values), len(config.used_models)))
-    evaluated_matrix.fill(np.nan)
+    evaluated_matrix = np.full((1, len(config.optimization_values), len(config.used_models)), np.nan)
 
-    for k in results.values():
-        evaluated_matrix[0, k["Index"][0], k["Index"][1]] = k["Model error"]
+    # Fill all models results at once with fancy indexing
+    results_indexes = np.array([k["Index"] for k in results.values()])
+    evaluated_matrix[0, results_indexes[:, 0], results_indexes[:, 1]] = [
+        k["Model error"] for k in results.values()
+    ]
 
     (
         _,
@@ -570,12 +639,10 @@ def predict(
     else:
         date_index = list(range(last_date + 1, last_date + config.predicts + 1))
 
-    predictions_df = pd.DataFrame(index=date_index)
-
     results_df.sort_values("Model error", inplace=True)
 
-    for i, row in results_df.iterrows():
-        predictions_df[i] = row["Results"]
+    # Created at once from dict, not column by column
+    predictions_df = pd.DataFrame(dict(zip(results_df.index, results_df["Results"])), index=date_index)
 
     if predictions_df.empty:
         raise RuntimeError(
@@ -589,11 +656,11 @@ def predict(
             j: best_models_optimized_values[i] for i, j in enumerate(config.used_models)
         }
 
-        best_indexes = []
-
-        for i, row in results_df.iterrows():
-            if row["Optimization value"] == best_optimized_values_dict[row["Name"]]:
-                best_indexes.append(i)
+        # Compare all rows at once with best value of its model. Numpy arrays, so None equals None
+        best_indexes = results_df.index[
+            results_df["Optimization value"].values
+            == results_df["Name"].map(best_optimized_values_dict).values
+        ].tolist()
 
         optimization_result = predictit._result_classes.Optimization(
             optimized_variable=config.variable_optimization.optimization_variable,
@@ -606,7 +673,7 @@ def predict(
         )
 
         predictions_df = predictions_df[best_indexes]
-        predictions_df.columns = [results_df.loc[i]["Name"] for i in predictions_df.columns]
+        predictions_df.columns = results_df.loc[best_indexes, "Name"].tolist()
         results_df = results_df.loc[best_indexes]
 
         results_df.rename(columns={"A": "Col_1"}, inplace=True)
@@ -656,11 +723,9 @@ def predict(
     else:
         best_model_name_plot = predictions_for_plot.columns[0]
 
-    bounds_df = pd.DataFrame(index=date_index)
-
-    if bounds:
-        bounds_df["Upper bound"] = upper_bound
-        bounds_df["Lower bound"] = lower_bound
+    bounds_df = pd.DataFrame(
+        {"Upper bound": upper_bound, "Lower bound": lower_bound} if bounds else {}, index=date_index
+    )
 
     last_value = float(column_for_predictions_series.iloc[-1, 0])
 
@@ -669,14 +734,31 @@ def predict(
         axis=1,
     )
 
-    predictions_with_history = pd.concat(
-        [
-            column_for_predictions_series[-config.plot_history_length :],
-            predictions_for_plot_limited,
-        ],
-        sort=False,
+    # Created from preallocated arrays. History keeps dtype of the data, so it's not converted to float64.
+    # Predictions start from last value, so lines are connected in plot
+    history = column_for_predictions_series.iloc[-config.plot_history_length :]
+    history_length = len(history)
+    with_history_length = history_length + len(predictions_for_plot_limited)
+
+    history_values = np.full(
+        with_history_length, np.nan, dtype=np.result_type(history.values.dtype, np.float32)
+    )
+    history_values[:history_length] = history.values[:, 0]
+
+    predictions_values = np.full(
+        (with_history_length, predictions_for_plot_limited.shape[1]),
+        np.nan,
+        dtype=np.result_type(*predictions_for_plot_limited.dtypes, np.float32),
+    )
+    predictions_values[history_length:] = predictions_for_plot_limited.values
+    predictions_values[history_length - 1] = last_value
+
+    predictions_with_history = pd.DataFrame(
+        predictions_values,
+        index=history.index.append(predictions_for_plot_limited.index),
+        columns=predictions_for_plot_limited.columns,
     )
-    predictions_with_history.iloc[-config.predicts - 1, :] = last_value
+    predictions_with_history.insert(0, history.columns[0], history_values)
 
     if config.sort_results_by == "name":
         results_df.sort_index(key=lambda x: x.str.lower(), inplace=True)
@@ -730,6 +812,8 @@ def predict(
     ### ANCHOR ### Table
     #############
 
+    from tabulate import tabulate
+
     time_df.append(["Complete time", round((time.time() - time_begin), 3)])
     time_df = pd.DataFrame(time_df, columns=["Part", "Time"])
 
@@ -742,17 +826,19 @@ def predict(
     detailed_table_df = mdp.misc.edit_table_to_printable(detailed_table_df)
 
     tables = predictit._result_classes.Tables(
-        simple=tabulate(
+        simple=partial(
+            tabulate,
             simple_table_df.values,
             headers=["Model", f"Average {config.error_criterion} error"],
             **config.table_settings,
         ),
-        detailed=tabulate(
+        detailed=partial(
+            tabulate,
             detailed_table_df.values,
             headers=detailed_table_df.columns,
             **config.table_settings,
         ),
-        time=tabulate(time_df.values, headers=time_df.columns, **config.table_settings),
+        time=partial(tabulate, time_df.values, headers=time_df.columns, **config.table_settings),
         simple_table_df=simple_table_df,
         detailed_table_df=detailed_table_df,
     )
@@ -780,22 +866,23 @@ def predict(
     ### ANCHOR ### Print
     #############
 
-    if config.print_result_details:
-        print(
-            (
-                f"\nBest model is {best_model_name} with results \n\n{best_model_predicts}\n\nWith model error {config.error_criterion} = "
-                f"{results_df.loc[best_model_name, 'Model error']}"
+    with collect_output:
+        if config.print_result_details:
+            print(
+                (
+                    f"\nBest model is {best_model_name} with results \n\n{best_model_predicts}\n\nWith model error {config.error_criterion} = "
+                    f"{results_df.loc[best_model_name, 'Model error']}"
+                )
             )
-        )
 
-    if config.print_table == "simple":
-        print(f"\n{tables.simple}\n")
+        if config.print_table == "simple":
+            print(f"\n{tables.simple}\n")
 
-    elif config.print_table == "detailed":
-        print(f"\n{tables.detailed}\n")
+        elif config.print_table == "detailed":
+            print(f"\n{tables.detailed}\n")
 
-    if config.print_time_table:
-        print(f"\n{tables.time}\n")
+        if config.print_time_table:
+            print(f"\n{tables.time}\n")
 
     ###############
     ### ANCHOR ### Return
@@ -803,10 +890,8 @@ def predict(
 
     mylogging.reset_outer_warnings_filter()
 
-    # Return stdout and stop collect warnings and printed output
     if _GUI:
-        output = sys.stdout.getvalue()
-        sys.stdout = stdout
+        output = gui_output.getvalue()
         result.output = output
         print(output)
 
@@ -822,6 +907,9 @@ def predict(
             "models_test_outputs": models_test_outputs,
         }
 
+    if cache_key:
+        predictit._helpers.cache_prediction(cache_key, deepcopy(result), config.prediction_cache_size)
+
     return result
 
 
@@ -857,12 +945,12 @@ def predict_multiple_columns(
     if config is None or isinstance(config, dict):
         update_config = config
         config = config_default
-        config = config.copy()
+        config = predictit._helpers.copy_config(config)
         if update_config:
             config.update(update_config)
 
     elif isinstance(config, predictit.configuration.Config):
-        config = config.copy()
+        config = predictit._helpers.copy_config(config)
 
     # Edit configuration.py default values with arguments values if exist
     if data is not None:
@@ -888,53 +976,95 @@ def predict_multiple_columns(
     else:
         freqs = config.data_input.freqs
 
-    if config.predicted_columns in ["*", ["*"]]:
-
-        if isinstance(config.data, str):
-            config.data = mdp.load_data.load_data(
-                config.data,
-                header=config.header,
-                csv_style=config.csv_style,
-                predicted_table=config.predicted_table,
-                max_imported_length=config.max_imported_length,
-                request_datatype_suffix=config.request_datatype_suffix,
-                data_orientation=config.data_orientation,
-            )
+    # Data are loaded only once, not in every predict call
+    if isinstance(config.data, (str, Path)):
+        config.data = predictit._helpers.load_data(config)
 
+    if config.predicted_columns in ["*", ["*"]]:
         config.predicted_columns = mdp.preprocessing.data_consolidation(config.data).columns
 
     results = {}
-    best_predictions_dataframes = {}
-
-    for fi, f in enumerate(freqs):
-
-        result_dataframe = pd.DataFrame()
-
-        for ci, c in enumerate(config.predicted_columns):
+    best_predictions = {f: {} for f in freqs}
+    jobs = [(f, c) for f in freqs for c in config.predicted_columns]
+
+    if config.multiprocessing and len(jobs) > 1:
+        # Columns are predicted in separate processes (or threads if configured), so models inside are evaluated
+        # serially to avoid nested pools. Config is not picklable, so it is sent as dict.
+        config_dict = config.get_dict()
+        config_dict["multiprocessing"] = None
+        processes_limit = config.processes_limit or max(multiprocessing.cpu_count() - 1, 1)
+        executor_class = ThreadPoolExecutor if config.multiprocessing == "thread" else ProcessPoolExecutor
+
+        with executor_class(min(processes_limit, len(jobs))) as executor:
+            futures = [executor.submit(_predict_column, config_dict, c, f) for f, c in jobs]
+    else:
+        futures = None
 
-            config.predicted_column = c
-            config.freq = f
+    for job_index, (f, c) in enumerate(jobs):
 
-            result_name = f"Column: {c}" if len(freqs) == 1 else f"Column: {c} - Freq: {f}"
+        result_name = f"Column: {c}" if len(freqs) == 1 else f"Column: {c} - Freq: {f}"
 
-            try:
+        try:
+            if futures is None:
+                config.predicted_column = c
+                config.freq = f
                 results[result_name] = predict(config=config)
+            else:
+                results[result_name] = futures[job_index].result()
 
-                result_dataframe[c] = results[result_name].best_prediction
+                # Config cannot be returned from process, so copy with values of this job is attached
+                job_config = predictit._helpers.copy_config(config)
+                job_config.predicted_column = c
+                job_config.freq = f
+                results[result_name].config = (job_config,)
 
-            except Exception:
-                mylogging.traceback(
-                    f"Error in making predictions on column {c} and freq {f}",
-                    level="ERROR",
-                )
+            best_predictions[f][c] = results[result_name].best_prediction
+
+        except Exception:
+            mylogging.traceback(
+                f"Error in making predictions on column {c} and freq {f}",
+                level="ERROR",
+            )
 
-        best_predictions_dataframes[f"Freq: {f}"] = result_dataframe
+    best_predictions_dataframes = {f"Freq: {f}": pd.DataFrame(best_predictions[f]) for f in freqs}
 
     return predictit._result_classes.Multiple(
         best_predictions_dataframes=best_predictions_dataframes, results=results
     )
 
 
+def _predict_column(config_dict: dict, predicted_column, freq) -> predictit._result_classes.Result:
+    """Predict one column in one frequency. Used as a worker in predict_multiple_columns.
+
+    Args:
+        config_dict (dict): Config values as dict, because Config instance cannot be pickled.
+        predicted_column (int | str): Predicted column index or name.
+        freq (str): Frequency of predicted data.
+
+    Returns:
+        predictit._result_classes.Result: Result with config removed, so it can be sent back to main process.
+    """
+    result = predict(config=config_dict, predicted_column=predicted_column, freq=freq)
+    result.config = None
+    return result
+
+
+def _evaluate_data(config_dict: dict, data, predicted_column, plot_name: str) -> np.ndarray:
+    """Evaluate all models on one data. Used as a worker in compare_models.
+
+    Args:
+        config_dict (dict): Config values as dict, because Config instance cannot be pickled.
+        data (np.ndarray | pd.DataFrame): Evaluated data.
+        predicted_column (int | str): Predicted column index or name.
+        plot_name (str): Name of data used in plot.
+
+    Returns:
+        np.ndarray: Evaluated matrix with errors of models.
+    """
+    result = predict(config=config_dict, data=data, predicted_column=predicted_column, plot_name=plot_name)
+    return result.misc.evaluated_matrix
+
+
 def compare_models(
     data_all=None,
     predicted_column: list | tuple | str | None = None,
@@ -966,12 +1096,12 @@ def compare_models(
     if config is None or isinstance(config, dict):
         update_config = config
         config = config_default
-        config = config.copy()
+        config = predictit._helpers.copy_config(config)
         if update_config:
             config.update(update_config)
 
     elif isinstance(config, predictit.configuration.Config):
-        config = config.copy()
+        config = predictit._helpers.copy_config(config)
 
     # Edit configuration.py default values with arguments values if exist
     if data_all is not None:
@@ -983,6 +1113,9 @@ def compare_models(
     # Edit config.py default values with arguments values if exist
     config.update(kwargs)
 
+    # Used models can be set, but order must be fixed, as results are stored and analyzed on model index
+    config.used_models = list(config.used_models)
+
     predictit._helpers.logger_init_from_config(config.output.logger_subconfig)
 
     # Edit config.py default values with arguments values if exist
@@ -1006,47 +1139,80 @@ def compare_models(
         }
         mylogging.warn("Test data was used. Setup 'data_all' in config...")
 
+    # Normalized to data name: (data, predicted column), so every data are processed the same way
     data_dict = config.data_all
-    same_data = False
 
     if isinstance(data_dict, (list, tuple, np.ndarray)):
-        same_data = True
         data_dict = {f"Data {i}": (j, config.predicted_column) for i, j in enumerate(data_dict)}
 
     optimization_number = len(config.optimization_values) if config.variable_optimization.optimization else 1
 
-    results_errors_absolute_array = np.zeros((len(data_dict), optimization_number, len(config.used_models)))
-    results_errors_absolute_array.fill(np.nan)
-    results_errors_standardized_array = results_errors_absolute_array.copy()
+    results_errors_absolute_array = np.full(
+        (len(data_dict), optimization_number, len(config.used_models)), np.nan
+    )
 
     all_models_results = {}
 
+    if config.multiprocessing and len(data_dict) > 1:
+        # Data are evaluated in separate processes (or threads if configured), so models inside are evaluated
+        # serially to avoid nested pools. Config is not picklable, so it is sent as dict.
+        config_dict = {key: value for key, value in config.get_dict().items() if key != "data_all"}
+        config_dict["multiprocessing"] = None
+        processes_limit = config.processes_limit or max(multiprocessing.cpu_count() - 1, 1)
+        executor_class = ThreadPoolExecutor if config.multiprocessing == "thread" else ProcessPoolExecutor
+
+        with executor_class(min(processes_limit, len(data_dict))) as executor:
+            futures = [
+                executor.submit(_evaluate_data, config_dict, j[0], j[1], i) for i, j in data_dict.items()
+            ]
+    else:
+        futures = None
+
     for g, (i, j) in enumerate(data_dict.items()):
 
-        config.data = j[0]
-        if not same_data:
-            config.predicted_column = j[1]
+        try:
 
-        config.plot_name = i
+            if futures is None:
+                config.data = j[0]
+                config.predicted_column = j[1]
+                config.plot_name = i
 
-        try:
+                evaluated_matrix = predict(config=config).misc.evaluated_matrix
+            else:
+                evaluated_matrix = futures[g].result()
 
-            prediction_result = predict(config=config)
             all_models_results[i] = j
-            evaluated_matrix = prediction_result.misc.evaluated_matrix
             results_errors_absolute_array[g] = evaluated_matrix
 
-            # Standardize results to be able to have average error through different data
-            if np.nanmax(evaluated_matrix) - np.nanmin(evaluated_matrix) > 0:
-                results_errors_standardized_array[g] = (evaluated_matrix - np.nanmin(evaluated_matrix)) / (
-                    np.nanmax(evaluated_matrix) - np.nanmin(evaluated_matrix)
-                )
-            else:
-                results_errors_standardized_array[g] = evaluated_matrix
-
         except Exception:
             mylogging.traceback(f"Comparison for data {i} didn't finished.", level="ERROR")
 
+    # Standardize results to be able to have average error through different data. Min and max are computed
+    # for all data at once, data where all the results are the same (or failed) are not standardized.
+    errors_per_data = results_errors_absolute_array.reshape(len(data_dict), -1)
+
+    if GLOBAL_VARS.BOTTLENECK_INSTALLED:
+        import bottleneck as bn
+
+        errors_min = bn.nanmin(errors_per_data, axis=1)
+        errors_max = bn.nanmax(errors_per_data, axis=1)
+
+    else:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            errors_min = np.nanmin(errors_per_data, axis=1)
+            errors_max = np.nanmax(errors_per_data, axis=1)
+
+    errors_min = errors_min[:, None, None]
+    errors_range = errors_max[:, None, None] - errors_min
+
+    standardizable = errors_range > 0
+    results_errors_standardized_array = np.where(
+        standardizable,
+        (results_errors_absolute_array - errors_min) / np.where(standardizable, errors_range, 1),
+        results_errors_absolute_array,
+    )
+
     (
         best_results_errors,
         best_models_optimized_values,
@@ -1073,15 +1239,18 @@ def compare_models(
         config.prediction.error_criterion,
     )
 
-    evaluated_results_df = pd.DataFrame(index=config.used_models)
-    evaluated_results_df["Errors average"] = best_results_errors
-    evaluated_results_df["Standardized\nerror average"] = best_results_errors_on_standardized_data
+    evaluated_results = {
+        "Errors average": best_results_errors,
+        "Standardized\nerror average": best_results_errors_on_standardized_data,
+    }
 
     if config.variable_optimization.optimization:
-        evaluated_results_df["Best optimized\nvalues"] = best_models_optimized_values
-        evaluated_results_df[
-            "Standardized best\noptimized values"
-        ] = best_models_optimized_values_on_standardized_data
+        evaluated_results["Best optimized\nvalues"] = best_models_optimized_values
+        evaluated_results["Standardized best\noptimized values"] = (
+            best_models_optimized_values_on_standardized_data
+        )
+
+    evaluated_results_df = pd.DataFrame(evaluated_results, index=config.used_models)
 
     if config.sort_results_by == "error":
         evaluated_results_df.sort_values("Errors average", inplace=True)
@@ -1114,12 +1283,14 @@ def compare_models(
         .reset_index()
     )
     tables = predictit._result_classes.Tables(
-        simple=tabulate(
+        simple=partial(
+            tabulate,
             simple_table_df.values,
             headers=simple_table_df.columns,
             **config.table_settings,
         ),
-        detailed=tabulate(
+        detailed=partial(
+            tabulate,
             detailed_table_df.values,
             headers=detailed_table_df.columns,
             **config.table_settings,
@@ -1210,12 +1381,12 @@ def find_optimal_input_for_models(config=None) -> predictit._result_classes.Best
     if config is None or isinstance(config, dict):
         update_config = config
         config = config_default
-        config = config.copy()
+        config = predictit._helpers.copy_config(config)
         if update_config:
             config.update(update_config)
 
     elif isinstance(config, predictit.configuration.Config):
-        config = config.copy()
+        config = predictit._helpers.copy_config(config)
 
     all_models = config.models.used_models
     all_parameters = config.models.models_parameters
@@ -1255,6 +1426,8 @@ if __name__ == "__main__":
 
     if len(sys.argv) > 1 and not GLOBAL_VARS.JUPYTER:
 
+        import argparse
+
         # Add settings from command line if used
         parser = argparse.ArgumentParser(
             usage=(
@@ -1266,21 +1439,21 @@ if __name__ == "__main__":
             ),
         )
 
-        config_dict = config_default.get_dict()
-
-        for i in config_dict.keys():
+        for i in config_default.get_dict():
             # TODO add help
             parser.add_argument(f"--{i}")
 
+        parser_args, unknown_args = parser.parse_known_args()
+
+        # Arguments that are not in config would be ignored silently
+        if unknown_args:
+            mylogging.warn(f"Unknown command line arguments {unknown_args} ignored. Maybe misspelled name.")
+
         # Non empty command line args
         parser_args_dict = {
-            k: mypythontools.misc.str_to_infer_type(v)
-            for k, v in parser.parse_known_args()[0].__dict__.items()
-            if v is not None
+            k: mypythontools.misc.str_to_infer_type(v) for k, v in vars(parser_args).items() if v is not None
         }
 
-        config_dict.update(parser_args_dict)
-
     if config_default.general.used_function == "predict":
         prediction_results = predict(config=parser_args_dict)
 
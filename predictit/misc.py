@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 import builtins
+import importlib.util
 
 import numpy as np
 
@@ -16,6 +17,9 @@ class Global_vars:
         self.JUPYTER: bool = True if hasattr(builtins, "__IPYTHON__") else False
         self.GUI: bool = False
         self.PLOTS_CONFIGURED: bool = False
+        # Checked once, so optional libraries are not searched in sys.path on every call
+        self.NUMBA_INSTALLED: bool = bool(importlib.util.find_spec("numba"))
+        self.BOTTLENECK_INSTALLED: bool = bool(importlib.util.find_spec("bottleneck"))
 
 
 GLOBAL_VARS = Global_vars()
@@ -119,3 +119,12 @@ models_assignment = {
     "Average short": average,
     "Average long": average,
 }
+
+# Models that compute mostly in numpy / BLAS that release GIL (or are cheap), so can run in threads. Sklearn models
+# are not here, as sklearn wrappers (e.g. MultiOutputRegressor) and BayesianRidge iterations hold GIL in Python.
+gil_releasing_models = {
+    "Regression",
+    "Ridge regression",
+    "Average short",
+    "Average long",
+}
@@ -243,15 +243,15 @@ def predict(x_input: np.ndarray, model: np.ndarray, predicts: int = 7) -> np.nda
     x_input = x_input.ravel().copy()
     w = model
 
-    predictions = []
+    predictions = np.empty(predicts, dtype=np.result_type(x_input, w))
 
     for i in range(predicts):
 
         ww = w[i] if w.ndim == 2 else w
         y_predicted = np.dot(ww, x_input)
-        predictions.append(y_predicted)
+        predictions[i] = y_predicted
 
         x_input[1:-1] = x_input[2:]
         x_input[-1] = y_predicted
 
-    return np.array(predictions).reshape(-1)
+    return predictions
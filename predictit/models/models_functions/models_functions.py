@@ -44,33 +44,34 @@ def one_step_looper(
     Note:
         It's important to correct constant param.
     """
-    predictions = []
-
     input_vector = x_input.copy()
 
+    # Predictions and shifted input are written in place, so there is no new array in every step. Slices are
+    # assigned, so it works if model returns scalar as well as array with one value. Predictions are always float64
+    # as model can return more precise values than input is.
+    predictions = np.empty(predicts, dtype=np.float64)
+
     if input_vector.ndim == 1:
-        for _ in range(predicts):
+        for i in range(predicts):
             ypre = model_function(input_vector)
-            predictions.append(ypre)
+            predictions[i : i + 1] = ypre
             if not constant:
                 input_vector[:-1] = input_vector[1:]
-                input_vector[-1] = ypre
             else:
                 input_vector[1:-1] = input_vector[2:]
-                input_vector[-1] = ypre
+            input_vector[-1:] = ypre
 
     elif input_vector.ndim == 2 and input_vector.shape[0] == 1:
-        for _ in range(predicts):
+        for i in range(predicts):
             ypre = model_function(input_vector)
-            predictions.append(ypre)
+            predictions[i : i + 1] = ypre
             if not constant:
                 input_vector[0, :-1] = input_vector[0, 1:]
-                input_vector[0, -1] = ypre
             else:
                 input_vector[0, 1:-1] = input_vector[0, 2:]
-                input_vector[0, -1] = ypre
+            input_vector[0, -1:] = ypre
 
     else:
         raise TypeError("Max ndim is 2.")
 
-    return np.array(predictions).reshape(-1)
+    return predictions
@@ -8,7 +8,7 @@ it can use function ``get_all_models()`` that return all existing regressor.
 """
 
 from __future__ import annotations
-from typing import Any
+from typing import Any, Callable
 
 import numpy as np
 
@@ -97,19 +97,14 @@ def train(
         # Sklearn extensions
         'ELMClassifier', 'ELMRegressor', 'GenELMClassifier', 'GenELMRegressor']
     """
-    from sklearn import (
-        multioutput,
-        linear_model,
-        ensemble,
-        tree,
-        neighbors,
-        gaussian_process,
-    )
+    from sklearn import linear_model, neighbors
 
     X, y = get_inputs(data)
 
     # If string like 'LinearRegression', find class with such a name
     if isinstance(model, str):
+        # Other modules imported only here, as they are slow to import and not necessary if model is object
+        from sklearn import ensemble, tree, gaussian_process
 
         for i in [linear_model, ensemble, tree, neighbors, gaussian_process]:
             if model in i.__all__:
@@ -168,10 +163,22 @@ def train(
         y = y.ravel()
 
     else:
-        if model._estimator_type == "regressor":
-            model = multioutput.MultiOutputRegressor(model)
-        elif model._estimator_type == "classifier":
-            model = multioutput.MultiOutputClassifier(model)
+        # Models that fit all outputs at once with the same results as one model per output
+        native_multioutput_models = (
+            linear_model.LinearRegression,
+            linear_model.Ridge,
+            linear_model.Lasso,
+            linear_model.ElasticNet,
+            neighbors.KNeighborsRegressor,
+        )
+
+        if type(model) not in native_multioutput_models:
+            from sklearn import multioutput
+
+            if model._estimator_type == "regressor":
+                model = multioutput.MultiOutputRegressor(model)
+            elif model._estimator_type == "classifier":
+                model = multioutput.MultiOutputClassifier(model)
 
         setattr(model, "output_shape", "multi_step")
 
@@ -196,8 +203,12 @@ def predict(x_input: np.ndarray, model: Any, predicts: int = 7) -> np.ndarray:
 
     if model.output_shape == "one_step":
 
+        model_function = _get_linear_predict_function(model) or (
+            lambda new_x_input: model.predict(new_x_input)
+        )
+
         return one_step_looper(
-            lambda new_x_input: model.predict(new_x_input),
+            model_function,
             x_input,
             predicts,
             constant=False,
@@ -208,6 +219,41 @@ def predict(x_input: np.ndarray, model: Any, predicts: int = 7) -> np.ndarray:
         return model.predict(x_input)[0].reshape(-1)
 
 
+def _get_linear_predict_function(model: Any) -> Callable | None:
+    """If model is linear sklearn regressor, return function computing prediction from fitted coefficients.
+    Predicting one value from sklearn model is mostly input validation overhead, so in one step loop this is
+    much faster than `model.predict`.
+
+    Args:
+        model (Any): Fitted sklearn model.
+
+    Returns:
+        Callable | None: Function with the same results as `model.predict` or None if model is not linear.
+    """
+    from sklearn import linear_model
+
+    linear_predicts = (
+        linear_model.LinearRegression.predict,
+        linear_model.BayesianRidge.predict,
+        linear_model.ARDRegression.predict,
+    )
+
+    if getattr(type(model), "predict", None) not in linear_predicts or np.ndim(model.coef_) != 1:
+        return None
+
+    coef = model.coef_
+    intercept = model.intercept_
+
+    def linear_predict(new_x_input: np.ndarray) -> np.ndarray:
+        # Not finite input (e.g. diverging prediction) is validated by model, so it raises the same error
+        if not np.isfinite(new_x_input).all():
+            return model.predict(new_x_input)
+
+        return new_x_input @ coef + intercept
+
+    return linear_predict
+
+
 def get_all_models(
     regressors: bool = True,
     classifiers: bool = True,
@@ -39,10 +39,24 @@ def test_compare_models_with_optimization():
     assert result
 
 
+
+def test_compare_models_parallel():
+    dummy_data = np.random.randn(300)
+    data_all = [dummy_data[:100], dummy_data[100:200], dummy_data[200:]]
+
+    serial_result = predictit.compare_models(data_all=data_all)
+
+    for multiprocessing in ("process", "thread"):
+        result = predictit.compare_models(data_all=data_all, multiprocessing=multiprocessing)
+
+        assert result.results_df.equals(serial_result.results_df)
+        assert result.best_model_name == serial_result.best_model_name
+
 if __name__ == "__main__":
 
     # test_compare_models()
     # test_compare_models_list()
     # test_compare_models_with_optimization()
+    # test_compare_models_parallel()
 
     pass
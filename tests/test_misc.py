@@ -1,4 +1,6 @@
 import numpy as np
+import pytest
+import pandas as pd
 
 import mydatapreprocessing as mdp
 import mypythontools
@@ -16,3 +18,136 @@ def test_other_models_functions():
     predictit.models.autoreg_LNU.train(sequences, plot=False)
 
     assert tf_optimizers and sklearn_regressors
+
+
+def test_one_step_looper_dtype():
+    x_input = np.random.randn(1, 6).astype(np.float32)
+
+    predictions = predictit.models.models_functions.models_functions.one_step_looper(
+        lambda x: x[0, -1] * 0.5, x_input, predicts=4
+    )
+
+    assert predictions.dtype == np.float64 and len(predictions) == 4
+
+
+def test_rolling_mean_std():
+    data = np.random.randn(200)
+    windows = np.lib.stride_tricks.sliding_window_view(data, 10)
+
+    rolling_mean, rolling_std = predictit.analyze._rolling_mean_std(data, 10)
+
+    assert np.allclose(rolling_mean, windows.mean(axis=1)) and np.allclose(rolling_std, windows.std(axis=1))
+
+
+def test_rolling_mean_std_big_offset():
+    data = np.random.randn(200) + 1e8
+
+    expected_std = np.lib.stride_tricks.sliding_window_view(data, 10).std(axis=1)
+
+    _, rolling_std = predictit.analyze._rolling_mean_std(data, 10)
+    assert np.allclose(rolling_std, expected_std)
+
+    if predictit.misc.GLOBAL_VARS.NUMBA_INSTALLED:
+        from predictit._numba_kernels import rolling_mean_std
+
+        _, rolling_std = rolling_mean_std(data, 10)
+        assert np.allclose(rolling_std, expected_std)
+
+
+def test_rolling_mean_std_nan():
+    pytest.importorskip("numba")
+    from predictit._numba_kernels import rolling_mean_std
+
+    for nan_index in (0, 50):
+        data = np.random.randn(200)
+        data[nan_index] = np.nan
+
+        expected_mean, expected_std = predictit.analyze._rolling_mean_std(data, 10)
+        rolling_mean, rolling_std = rolling_mean_std(data, 10)
+
+        assert np.allclose(rolling_mean, expected_mean, equal_nan=True)
+        assert np.allclose(rolling_std, expected_std, equal_nan=True)
+
+
+def test_describe_big_offset():
+    data = np.random.randn(200) + 1e8
+    data[5] = np.nan
+
+    minimum, maximum, mean, std, nan_count = predictit.analyze._describe(data)
+
+    assert np.isclose(std, np.nanstd(data)) and np.isclose(mean, np.nanmean(data)) and nan_count == 1
+
+
+def test_fft_acf():
+    from statsmodels.tsa.stattools import acf
+
+    data = np.cumsum(np.random.randn(300))
+
+    assert np.allclose(predictit.analyze._fft_acf(data, 20), acf(data, nlags=20, fft=False))
+
+
+def test_error_criterions(monkeypatch):
+    pytest.importorskip("numba")
+
+    predicted = np.random.randn(20)
+    test = np.random.randn(20) * 3
+
+    errors = {}
+
+    for numba in (True, False):
+        monkeypatch.setattr(predictit.misc.GLOBAL_VARS, "NUMBA_INSTALLED", numba)
+        errors[numba] = [
+            predictit.evaluate_predictions.compare_predicted_to_test(predicted, test, error_criterion=i)
+            for i in ("mape", "rmse")
+        ]
+
+    assert np.allclose(errors[True], errors[False])
+
+
+def test_load_data_cache(tmp_path):
+    data_path = tmp_path / "data.csv"
+    pd.DataFrame(np.random.randn(50, 2), columns=["a", "b"]).to_csv(data_path, index=False)
+
+    config = predictit.config.copy()
+    config.update({"data": data_path.as_posix(), "data_cache_folder": tmp_path / "cache"})
+
+    loaded = predictit._helpers.load_data(config)
+    loaded_from_cache = predictit._helpers.load_data(config)
+
+    assert len(list((tmp_path / "cache").iterdir())) == 1 and loaded.equals(loaded_from_cache)
+
+
+def test_prediction_cache():
+    config = predictit.config.copy()
+    config.update({"data": np.random.randn(100), "prediction_cache_size": 1})
+
+    predictit._helpers.prediction_cache.clear()
+    cache_key = predictit._helpers.get_prediction_cache_key(config)
+
+    predictit._helpers.cache_prediction(cache_key, "cached", config.prediction_cache_size)
+    predictit._helpers.cache_prediction("other", "newer", config.prediction_cache_size)
+
+    assert cache_key == predictit._helpers.get_prediction_cache_key(predictit._helpers.copy_config(config))
+    assert list(predictit._helpers.prediction_cache.values()) == ["newer"]
+
+    predictit._helpers.prediction_cache.clear()
+
+
+def test_analyze_results_keeps_input():
+    results = np.array([[[0.1, np.nan, 0.3]]])
+
+    predictit.analyze.analyze_results(results, ["Not optimized"], ["a", "b", "c"])
+
+    assert np.isnan(results[0, 0, 1])
+
+
+def test_correlation_with_nan_big_offset():
+    data = pd.DataFrame(np.random.randn(200, 3) + 1e6, columns=["a", "b", "c"])
+    data["c"] = data["a"] + np.random.randn(200) * 0.1
+    data.iloc[3, 1] = np.nan
+
+    correlation = predictit.analyze._correlation(data, data.isna())
+
+    assert np.allclose(correlation, data.corr()) and predictit.analyze._correlation(
+        pd.DataFrame({"a": ["x", "y"]}), pd.DataFrame({"a": [False, False]})
+    ).empty
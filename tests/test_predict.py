@@ -243,6 +243,66 @@ def test_most_models():
     assert result.predictions.isnull().sum().sum() <= 2
 
 
+def test_used_models_set():
+    config.update({"data": np.random.randn(200), "used_models": {"Conjugate gradient", "Average short"}})
+
+    result = predictit.predict()
+
+    assert set(result.results_df.index) == {"Conjugate gradient", "Average short"}
+
+
+def test_with_history_dtype():
+    config.update(
+        {
+            "data": np.random.randn(200),
+            "dtype": "float32",
+            "used_models": ["Conjugate gradient", "Regression"],
+        }
+    )
+
+    result = predictit.predict()
+
+    assert result.with_history.dtypes.iloc[0] == np.float32 and np.isnan(result.with_history.iloc[-1, 0])
+    assert validate_result(result.with_history.iloc[-config.predicts - 1 :, 1:])
+
+
+def test_prediction_cache():
+    import warnings
+
+    config.update(
+        {"data": np.random.randn(200), "used_models": ["Conjugate gradient"], "prediction_cache_size": 2}
+    )
+    predictit._helpers.prediction_cache.clear()
+
+    try:
+        result = predictit.predict()
+        filters_number = len(warnings.filters)
+        cached_result = predictit.predict()
+
+        assert len(predictit._helpers.prediction_cache) == 1
+        assert cached_result is not result and cached_result.best_prediction.equals(result.best_prediction)
+        assert len(warnings.filters) == filters_number
+
+    finally:
+        predictit._helpers.prediction_cache.clear()
+
+
+def test_thread_multiprocessing():
+    config.update({"used_models": ["Regression", "Ridge regression", "Average short"]})
+
+    # Memory tracing is not possible in threads, so models are evaluated serially
+    serial_result = predictit.predict(trace_processes_memory=True)
+    thread_result = predictit.predict(multiprocessing="thread")
+    auto_result = predictit.predict()
+
+    assert serial_result.config[0].multiprocessing is None
+    assert auto_result.config[0].multiprocessing == "thread"
+
+    for result in (thread_result, auto_result):
+        assert result.results_df["Model error"].equals(serial_result.results_df["Model error"])
+        assert result.best_prediction.equals(serial_result.best_prediction)
+
+
 def test_presets():
     config.update(
         {
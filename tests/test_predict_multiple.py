@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 import mypythontools
@@ -38,8 +39,31 @@ def test_main_multiple():
     )
 
 
+
+def test_main_multiple_parallel():
+    config.update(
+        {
+            "data": np.random.randn(150, 3),
+            "predicted_columns": [0, 1, 2],
+            "used_models": ["Conjugate gradient", "Regression"],
+        }
+    )
+
+    serial_result = predictit.predict_multiple_columns()
+
+    for multiprocessing in ("process", "thread"):
+        result = predictit.predict_multiple_columns(multiprocessing=multiprocessing)
+
+        assert list(result.results) == list(serial_result.results)
+        assert all(
+            result.best_predictions_dataframes[i].equals(serial_result.best_predictions_dataframes[i])
+            for i in serial_result.best_predictions_dataframes
+        )
+        assert [i.config[0].predicted_column for i in result.results.values()] == [0, 1, 2]
+
 if __name__ == "__main__":
 
     # test_main_multiple()
+    # test_main_multiple_parallel()
 
     pass